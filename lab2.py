@@ -1,20 +1,26 @@
 import pygame
-from pygame.locals import QUIT, KEYDOWN, K_LEFT, K_RIGHT, K_UP, K_DOWN, K_SPACE, K_r
+from pygame.locals import QUIT, KEYDOWN, KEYUP, WINDOWEXPOSED, K_LEFT, K_RIGHT, K_UP, K_DOWN, K_SPACE, K_r
 import random
 from abc import ABC, abstractmethod
+from collections import defaultdict
+
+# Размер ячейки пространственной сетки для проверки столкновений (≈ ширина врага)
+CELL_SIZE = 20
+# Частота кадров и фиксированный шаг физики (мс); скорости объектов заданы в пикселях за шаг.
+# Шаг целый, как и кадр, который выдерживает Clock.tick(FPS) (16 мс при 60 FPS): с шагом 1000 / FPS = 16.67 мс
+# на кадрах по 16 мс накопитель регулярно не дотягивал до шага, и такой кадр проходил без физики (рывок)
+FPS = 60
+PHYSICS_STEP_MS = 1000 // FPS
+# Максимум шагов физики за один кадр, чтобы после долгой паузы игра не «догоняла» время бесконечно
+MAX_PHYSICS_STEPS = 5
 
 # ============================
-# Singleton: метакласс для реализации одиночки (SingletonType)
+# Singleton: единственный экземпляр GameManager на уровне модуля (GAME)
 # ============================
-class SingletonType(type):
-    def __call__(cls, *args, **kwargs):
-        if not hasattr(cls, "_instance"):
-            cls._instance = super().__call__(*args, **kwargs)
-        return cls._instance
-
-# Глобальный менеджер игры, реализованный как Singleton.
+# Глобальный менеджер игры, реализованный как Singleton: модуль создаёт единственный экземпляр GAME,
+# и все обращаются к нему напрямую.
 # Хранит общее состояние игры: экран, размеры, игрока, списки врагов и пуль, фабрику объектов, счёт и уровень.
-class GameManager(metaclass=SingletonType):
+class GameManager:
     def __init__(self):
         self.screen = None          # Экран Pygame
         self.width = 0              # Ширина экрана
@@ -26,37 +32,62 @@ class GameManager(metaclass=SingletonType):
         self.score = 0              # Счёт игрока
         self.level = 1              # Уровень игры
 
+GAME = GameManager()
+
 # ============================
 # Flyweight: Фабрика спрайтов для разделяемых ресурсов
 # ============================
 class SpriteFlyweightFactory:
-    _sprites = {}  # Кеш созданных спрайтов: ключом является (name, color)
+    _sprites = {}          # Кеш спрайтов стандартного цвета: ключом является name
+    _colored_sprites = {}  # Кеш спрайтов произвольного цвета: ключом является (name, color)
+    # Стандартные цвета спрайтов игры
+    DEFAULT_COLORS = {'enemy': (255, 0, 0), 'bullet': (255, 255, 0), 'player': (0, 255, 0)}
 
     @staticmethod
-    def get_sprite(name, color=(255, 255, 255)):
+    def init_sprites():
+        """Создаёт спрайты стандартных цветов заранее, чтобы get_sprite сводился к одному обращению к словарю."""
+        for name, color in SpriteFlyweightFactory.DEFAULT_COLORS.items():
+            SpriteFlyweightFactory._sprites[name] = SpriteFlyweightFactory._create_sprite(name, color)
+
+    @staticmethod
+    def get_sprite(name, color=None):
         """
-        Возвращает Surface для заданного типа объекта с указанным цветом.
-        Если спрайт ещё не создан, создаёт новый и сохраняет его в кеше.
+        Возвращает Surface для заданного типа объекта.
+        Без color возвращает заранее созданный спрайт стандартного цвета;
+        с color - спрайт указанного цвета, который создаётся один раз и сохраняется в кеше.
         """
+        if color is None:
+            sprites = SpriteFlyweightFactory._sprites
+            if name not in sprites:
+                color = SpriteFlyweightFactory.DEFAULT_COLORS.get(name, (255, 255, 255))
+                sprites[name] = SpriteFlyweightFactory._create_sprite(name, color)
+            return sprites[name]
         key = (name, color)
-        if key not in SpriteFlyweightFactory._sprites:
-            if name == 'enemy':
-                # Простой квадрат 20x20 для врага
-                surface = pygame.Surface((20, 20))
-                surface.fill(color)
-            elif name == 'bullet':
-                # Прямоугольник 5x10 для пули
-                surface = pygame.Surface((5, 10))
-                surface.fill(color)
-            elif name == 'player':
-                # Прямоугольник 50x30 для игрока
-                surface = pygame.Surface((50, 30))
-                surface.fill(color)
-            else:
-                surface = pygame.Surface((20, 20))
-                surface.fill(color)
-            SpriteFlyweightFactory._sprites[key] = surface
-        return SpriteFlyweightFactory._sprites[key]
+        if key not in SpriteFlyweightFactory._colored_sprites:
+            SpriteFlyweightFactory._colored_sprites[key] = SpriteFlyweightFactory._create_sprite(name, color)
+        return SpriteFlyweightFactory._colored_sprites[key]
+
+    @staticmethod
+    def _create_sprite(name, color):
+        if name == 'enemy':
+            # Простой квадрат 20x20 для врага
+            surface = pygame.Surface((20, 20))
+            surface.fill(color)
+        elif name == 'bullet':
+            # Прямоугольник 5x10 для пули
+            surface = pygame.Surface((5, 10))
+            surface.fill(color)
+        elif name == 'player':
+            # Прямоугольник 50x30 для игрока
+            surface = pygame.Surface((50, 30))
+            surface.fill(color)
+        else:
+            surface = pygame.Surface((20, 20))
+            surface.fill(color)
+        # Приводим к формату пикселей экрана, чтобы blit не конвертировал пиксели на каждом кадре.
+        # Поэтому спрайты можно создавать только после pygame.display.set_mode, а при смене
+        # режима экрана кеш нужно создавать заново.
+        return surface.convert()
 
 # ============================
 # Abstract Factory: Абстрактная фабрика для создания игровых объектов
@@ -76,42 +107,70 @@ class GameObjectFactory(ABC):
 
 # Конкретная фабрика игровых объектов.
 # Использует паттерн Prototype для врагов и пуль: хранит прототипы и клонирует их при создании новых объектов.
+# Чтобы не нагружать сборщик мусора, фабрика держит пулы (free-list) отработавших пуль и врагов
+# и переиспользует их вместо клонирования новых объектов.
 class SimpleGameFactory(GameObjectFactory):
-    def __init__(self):
+    def __init__(self, bullet_pool_size=128, enemy_pool_size=64):
         # Создаем прототипы врага и пули.
         # Здесь нельзя создать экземпляр абстрактного класса, поэтому вызываем конструкторы уже конкретных объектов.
         # В данном примере для врага используем класс Enemy, который реализует update() ниже.
         self.enemy_prototype = Enemy(0, 0)
         self.bullet_prototype = Bullet(0, 0)
+        # Заранее заполняем пулы, чтобы во время игры объекты не создавались вовсе
+        self._bullet_pool = [self.bullet_prototype.clone() for _ in range(bullet_pool_size)]
+        self._enemy_pool = [self.enemy_prototype.clone() for _ in range(enemy_pool_size)]
 
     def create_player(self, x, y):
         return Player(x, y)
 
     def create_enemy(self):
-        # Клонируем прототип врага.
-        new_enemy = self.enemy_prototype.clone()
+        if self._enemy_pool:
+            # Берём врага из пула и возвращаем ему параметры прототипа
+            new_enemy = self._enemy_pool.pop()
+            new_enemy.rect.topleft = self.enemy_prototype.rect.topleft
+            new_enemy.speed = self.enemy_prototype.speed
+        else:
+            # Пул пуст - клонируем прототип врага.
+            new_enemy = self.enemy_prototype.clone()
         return new_enemy
 
     def create_bullet(self, x, y):
-        new_bullet = self.bullet_prototype.clone()
+        if self._bullet_pool:
+            new_bullet = self._bullet_pool.pop()
+            new_bullet.speed = self.bullet_prototype.speed
+        else:
+            new_bullet = self.bullet_prototype.clone()
         new_bullet.rect.centerx = x
         new_bullet.rect.bottom = y
         return new_bullet
 
+    def release_enemy(self, enemy):
+        """Возвращает отработавшего врага в пул для повторного использования."""
+        self._enemy_pool.append(enemy)
+
+    def release_bullet(self, bullet):
+        """Возвращает отработавшую пулю в пул для повторного использования."""
+        self._bullet_pool.append(bullet)
+
 # ============================
 # Proxy: Класс-заместитель для оружия, ограничивающий частоту выстрелов
 # ============================
 class Gun:
-    def __init__(self, factory):
+    __slots__ = ('factory', 'bullets_list')
+
+    def __init__(self, factory, bullets_list):
         self.factory = factory  # Фабрика для создания пуль
+        # Список пуль игры; он не пересоздаётся (очищается и пересобирается на месте), поэтому ссылку можно хранить
+        self.bullets_list = bullets_list
 
     def fire(self, x, y):
-        """Создает пулю через фабрику и добавляет её в список пуль в GameManager."""
-        bullet = self.factory.create_bullet(x, y)
-        GameManager().bullets.append(bullet)
+        """Создает пулю через фабрику и добавляет её в список пуль игры."""
+        self.bullets_list.append(self.factory.create_bullet(x, y))
         # Здесь можно добавить звуковой эффект выстрела.
 
 class GunProxy:
+    __slots__ = ('_real_gun', 'cooldown', 'last_shot_time')
+
     def __init__(self, real_gun, cooldown_ms):
         self._real_gun = real_gun      # Реальное оружие
         self.cooldown = cooldown_ms    # Задержка между выстрелами (в мс)
@@ -129,15 +188,17 @@ class GunProxy:
 # ============================
 class Enemy:
     """Класс врага."""
+    __slots__ = ('image', 'rect', 'speed')  # без __dict__: объекты меньше и быстрее доступ к атрибутам
+
     def __init__(self, x, y):
-        self.image = SpriteFlyweightFactory.get_sprite('enemy', (255, 0, 0))
+        self.image = SpriteFlyweightFactory.get_sprite('enemy')
         self.rect = self.image.get_rect()
         self.rect.topleft = (x, y)
         self.speed = 2  # скорость движения вниз
 
     def update(self):
         """Обновляет позицию врага (движется вниз)."""
-        self.rect.y += self.speed
+        self.rect.move_ip(0, self.speed)
 
     def clone(self):
         """Возвращает копию врага, используя его текущие параметры."""
@@ -147,8 +208,10 @@ class Enemy:
 
 class Bullet:
     """Класс пули."""
+    __slots__ = ('image', 'rect', 'speed')
+
     def __init__(self, x, y):
-        self.image = SpriteFlyweightFactory.get_sprite('bullet', (255, 255, 0))
+        self.image = SpriteFlyweightFactory.get_sprite('bullet')
         self.rect = self.image.get_rect()
         self.rect.centerx = x
         self.rect.bottom = y
@@ -156,7 +219,7 @@ class Bullet:
 
     def update(self):
         """Обновляет позицию пули (движется вверх)."""
-        self.rect.y += self.speed
+        self.rect.move_ip(0, self.speed)
 
     def clone(self):
         """Возвращает копию пули с текущими параметрами."""
@@ -168,31 +231,93 @@ class Bullet:
 # Класс игрока
 # ============================
 class Player:
+    __slots__ = ('image', 'rect', 'speed', 'gun', 'bounds')
+
     def __init__(self, x, y):
-        self.image = SpriteFlyweightFactory.get_sprite('player', (0, 255, 0))
+        self.image = SpriteFlyweightFactory.get_sprite('player')
         self.rect = self.image.get_rect()
         self.rect.midbottom = (x, y)
         self.speed = 5
+        # Границы экрана, в которых может находиться игрок
+        self.bounds = pygame.Rect(0, 0, GAME.width, GAME.height)
         # Создаем оружие: реальное оружие оборачиваем в Proxy для ограничения стрельбы.
-        real_gun = Gun(GameManager().factory)
+        real_gun = Gun(GAME.factory, GAME.bullets)
         self.gun = GunProxy(real_gun, cooldown_ms=300)
 
     def move(self, dx, dy):
-        self.rect.x += dx
-        self.rect.y += dy
-        gm = GameManager()
-        if self.rect.left < 0:
-            self.rect.left = 0
-        if self.rect.right > gm.width:
-            self.rect.right = gm.width
-        if self.rect.top < 0:
-            self.rect.top = 0
-        if self.rect.bottom > gm.height:
-            self.rect.bottom = gm.height
+        self.rect.move_ip(dx, dy)
+        # Не выходить за границы экрана: одно ограничение на C вместо четырёх проверок
+        self.rect.clamp_ip(self.bounds)
 
     def shoot(self):
         self.gun.fire(self.rect.centerx, self.rect.top)
 
+# ============================
+# Физика: движение, отсечение и столкновения
+# ============================
+def _grid_hit(grid, rect, skip):
+    """Возвращает первого врага из ячеек сетки под rect, который пересекается с rect и не входит в skip, либо None."""
+    for cx in range(rect.left // CELL_SIZE, (rect.right - 1) // CELL_SIZE + 1):
+        for cy in range(rect.top // CELL_SIZE, (rect.bottom - 1) // CELL_SIZE + 1):
+            bucket = grid.get((cx, cy))
+            if bucket is not None:
+                cell_enemies, cell_rects = bucket
+                for i in rect.collidelistall(cell_rects):
+                    if cell_enemies[i] not in skip:
+                        return cell_enemies[i]
+    return None
+
+def step_objects(bullets, enemies, height, player_rect):
+    """
+    Сдвигает пули и врагов на один шаг, отсекает вышедших за экран и проверяет попадания пуль во врагов
+    и столкновение врагов с игроком. Списки пересобираются на месте и содержат только выживших.
+    Возвращает списки убитых пуль и врагов (для возврата в пулы), число сбитых врагов
+    и признак столкновения врага с игроком.
+    """
+    # Каждый список обходится ровно один раз: движение (как в Enemy.update/Bullet.update, но без
+    # вызова метода на каждый объект), отсечение вышедших за экран и проверка столкновений.
+    # Враги заносятся во все ячейки пространственной сетки, которые они перекрывают,
+    # а пуля и игрок проверяются только против врагов из своих ячеек. Ячейка хранит список врагов
+    # и параллельный список их Rect, чтобы перебор пересечений выполнял collidelistall на C.
+    grid = defaultdict(lambda: ([], []))
+    alive_enemies = []
+    dead_enemies = []
+    for enemy in enemies:
+        r = enemy.rect
+        r.move_ip(0, enemy.speed)
+        if r.top > height:
+            dead_enemies.append(enemy)
+            continue
+        alive_enemies.append(enemy)
+        for cx in range(r.left // CELL_SIZE, (r.right - 1) // CELL_SIZE + 1):
+            for cy in range(r.top // CELL_SIZE, (r.bottom - 1) // CELL_SIZE + 1):
+                cell_enemies, cell_rects = grid[(cx, cy)]
+                cell_enemies.append(enemy)
+                cell_rects.append(r)
+    # Судьба пули решается в её же итерации, поэтому выжившие пули собираются сразу
+    killed = set()
+    alive_bullets = []
+    dead_bullets = []
+    for bullet in bullets:
+        r = bullet.rect
+        r.move_ip(0, bullet.speed)
+        if r.bottom < 0:
+            dead_bullets.append(bullet)
+            continue
+        hit = _grid_hit(grid, r, killed)
+        if hit is not None:
+            dead_bullets.append(bullet)
+            killed.add(hit)
+        else:
+            alive_bullets.append(bullet)
+    bullets[:] = alive_bullets
+    if killed:
+        alive_enemies = [e for e in alive_enemies if e not in killed]
+        dead_enemies.extend(killed)
+    enemies[:] = alive_enemies
+    player_hit = _grid_hit(grid, player_rect, killed) is not None
+    return dead_bullets, dead_enemies, len(killed), player_hit
+
 # ============================
 # Facade: Фасад для управления игровым процессом
 # ============================
@@ -200,18 +325,21 @@ class GameFacade:
     def __init__(self, width=800, height=600):
         pygame.init()
         # Инициализируем глобальное состояние игры
-        self.manager = GameManager()
+        self.manager = GAME
         self.manager.width = width
         self.manager.height = height
         self.manager.screen = pygame.display.set_mode((width, height))
         pygame.display.set_caption("Shooter Game with Patterns")
+        # Заранее создаём разделяемые спрайты (Flyweight)
+        SpriteFlyweightFactory.init_sprites()
         # Устанавливаем фабрику игровых объектов
         self.manager.factory = SimpleGameFactory()
+        # Очищаем списки врагов и пуль (на месте: оружие игрока хранит ссылку на список пуль)
+        self.manager.enemies.clear()
+        self.manager.bullets.clear()
         # Создаем игрока через фабрику
         self.manager.player = self.manager.factory.create_player(width // 2, height)
-        # Очищаем списки врагов и пуль, а также сбрасываем счёт и уровень
-        self.manager.enemies = []
-        self.manager.bullets = []
+        # Сбрасываем счёт и уровень
         self.manager.score = 0
         self.manager.level = 1
         # Устанавливаем событие таймера для генерации врагов
@@ -220,9 +348,25 @@ class GameFacade:
         pygame.time.set_timer(self.ENEMY_SPAWN_EVENT, 1000)
         # Шрифт для отрисовки счета и уровня на экране
         self.font = pygame.font.SysFont(None, 30)
+        # Кеш отрисованного текста: (значение, Surface). Текст перерисовывается только при изменении значения
+        self._score_cache = (None, None)
+        self._level_cache = (None, None)
+        # Области экрана, занятые объектами на прошлом кадре (стираются и обновляются на следующем)
+        self._prev_rects = []
+        self._background = None
+        # Нужно ли перерисовать и вывести весь экран (после того как окно было перекрыто или свёрнуто)
+        self._full_redraw = False
+        # Накопленное, но ещё не просчитанное физикой время (мс)
+        self._accumulator = 0.0
+        # Зажат ли пробел: обновляется по событиям KEYDOWN/KEYUP, а не опросом клавиатуры каждый кадр
+        self._shooting = False
 
     def reset_game(self):
         """Сбрасывает игру: очищает списки врагов и пуль, сбрасывает счёт, возвращает игрока в исходную позицию, устанавливает начальные параметры уровня."""
+        for enemy in self.manager.enemies:
+            self.manager.factory.release_enemy(enemy)
+        for bullet in self.manager.bullets:
+            self.manager.factory.release_bullet(bullet)
         self.manager.enemies.clear()
         self.manager.bullets.clear()
         self.manager.player.rect.midbottom = (self.manager.width // 2, self.manager.height)
@@ -254,84 +398,132 @@ class GameFacade:
         enemy.rect.y = 0
         self.manager.enemies.append(enemy)
 
-    def run_game(self):
-        """Запускает основной игровой цикл."""
-        clock = pygame.time.Clock()
+    def _process_events(self):
+        """Обрабатывает очередь событий. Возвращает False, если игру нужно завершить."""
+        spawn_event = self.ENEMY_SPAWN_EVENT
         running = True
-        while running:
-            for event in pygame.event.get():
-                if event.type == QUIT:
-                    running = False
-                elif event.type == KEYDOWN:
-                    if event.key == K_r:
-                        self.reset_game()
-                elif event.type == self.ENEMY_SPAWN_EVENT:
-                    self.spawn_enemy()
-            # Обработка ввода: движение игрока и стрельба
-            keys = pygame.key.get_pressed()
-            dx = dy = 0
-            if keys[K_LEFT]:
-                dx -= self.manager.player.speed
-            if keys[K_RIGHT]:
-                dx += self.manager.player.speed
-            if keys[K_UP]:
-                dy -= self.manager.player.speed
-            if keys[K_DOWN]:
-                dy += self.manager.player.speed
-            self.manager.player.move(dx, dy)
-            if keys[K_SPACE]:
-                self.manager.player.shoot()
-
-            # Обновление пуль
-            for bullet in list(self.manager.bullets):
-                bullet.update()
-            # Обновление врагов
-            for enemy in list(self.manager.enemies):
-                enemy.update()
-
-            # Проверка столкновений пуль с врагами
-            for bullet in list(self.manager.bullets):
-                for enemy in list(self.manager.enemies):
-                    if bullet.rect.colliderect(enemy.rect):
-                        if bullet in self.manager.bullets:
-                            self.manager.bullets.remove(bullet)
-                        if enemy in self.manager.enemies:
-                            self.manager.enemies.remove(enemy)
-                        self.manager.score += 1
-                        break
-
-            # Удаление пуль, вышедших за верхнюю границу экрана
-            for bullet in list(self.manager.bullets):
-                if bullet.rect.bottom < 0:
-                    self.manager.bullets.remove(bullet)
-            # Удаление врагов, вышедших за нижнюю границу
-            for enemy in list(self.manager.enemies):
-                if enemy.rect.top > self.manager.height:
-                    self.manager.enemies.remove(enemy)
-            # Проверка столкновений врагов с игроком (при столкновении игра сбрасывается)
-            for enemy in list(self.manager.enemies):
-                if enemy.rect.colliderect(self.manager.player.rect):
+        for event in pygame.event.get():
+            if event.type == QUIT:
+                running = False
+            elif event.type == KEYDOWN:
+                if event.key == K_r:
                     self.reset_game()
-                    break
+                elif event.key == K_SPACE:
+                    self._shooting = True
+            elif event.type == KEYUP:
+                if event.key == K_SPACE:
+                    self._shooting = False
+            elif event.type == spawn_event:
+                self.spawn_enemy()
+            elif event.type == WINDOWEXPOSED:
+                # Содержимое окна потеряно - следующий кадр выводится целиком
+                self._full_redraw = True
+        return running
+
+    def _tick_physics(self, dt):
+        """
+        Продвигает игру на dt миллисекунд фиксированными шагами PHYSICS_STEP_MS:
+        при подтормаживании кадра выполняется несколько шагов подряд, и игра не замедляется.
+        """
+        # Локальные ссылки вместо цепочек атрибутов self.manager.* в цикле шагов
+        manager = self.manager
+        player = manager.player
+        player_rect = player.rect
+        bullets = manager.bullets
+        enemies = manager.enemies
+        release_bullet = manager.factory.release_bullet
+        release_enemy = manager.factory.release_enemy
+        height = manager.height
+        accumulator = self._accumulator + dt
+        # Обработка ввода: движение игрока и стрельба
+        keys = pygame.key.get_pressed()
+        steps = 0
+        while accumulator >= PHYSICS_STEP_MS and steps < MAX_PHYSICS_STEPS:
+            speed = player.speed
+            # Смещение без ветвлений: разность булевых значений даёт -1, 0 или 1
+            player.move((keys[K_RIGHT] - keys[K_LEFT]) * speed, (keys[K_DOWN] - keys[K_UP]) * speed)
+            # Пока пробел не зажат, GunProxy.fire (и его вызов pygame.time.get_ticks) не вызывается вовсе
+            if self._shooting:
+                player.shoot()
+
+            # Движение, отсечение и столкновения; убитые объекты возвращаются в пулы фабрики,
+            # а при столкновении врага с игроком игра сбрасывается
+            dead_bullets, dead_enemies, kills, player_hit = step_objects(bullets, enemies, height, player_rect)
+            manager.score += kills
+            for bullet in dead_bullets:
+                release_bullet(bullet)
+            for enemy in dead_enemies:
+                release_enemy(enemy)
+            if player_hit:
+                self.reset_game()
 
             # Обновляем уровень, если необходимо (изменения параметров в зависимости от счёта)
             self.update_level()
-
-            # Отрисовка игровых объектов
-            self.manager.screen.fill((0, 0, 0))
-            self.manager.screen.blit(self.manager.player.image, self.manager.player.rect)
-            for enemy in self.manager.enemies:
-                self.manager.screen.blit(enemy.image, enemy.rect)
-            for bullet in self.manager.bullets:
-                self.manager.screen.blit(bullet.image, bullet.rect)
-            # Отображаем счёт и уровень на экране
-            score_text = self.font.render(f"Score: {self.manager.score}", True, (255, 255, 255))
-            level_text = self.font.render(f"Level: {self.manager.level}", True, (255, 255, 255))
-            self.manager.screen.blit(score_text, (10, 10))
-            self.manager.screen.blit(level_text, (10, 40))
-
+            accumulator -= PHYSICS_STEP_MS
+            steps += 1
+        if accumulator >= PHYSICS_STEP_MS:
+            # Слишком большое отставание (например, окно перетаскивали) - не пытаемся его догнать
+            accumulator = 0.0
+        self._accumulator = accumulator
+
+    def _draw_frame(self):
+        """
+        Рисует кадр. Экран целиком не очищается: фоном стираются только области,
+        где объекты были на прошлом кадре, и на дисплей выводятся только старые и новые области.
+        """
+        manager = self.manager
+        player = manager.player
+        screen = manager.screen
+        screen_blit = screen.blit
+        screen_blits = screen.blits
+        font_render = self.font.render
+        prev_rects = self._prev_rects
+        background = self._background
+        full_redraw = self._full_redraw
+        if full_redraw:
+            # После перекрытия окна экран очищается и выводится целиком
+            screen_blit(background, (0, 0))
+            prev_rects = []
+            self._full_redraw = False
+        else:
+            screen_blits([(background, rect, rect) for rect in prev_rects], doreturn=False)
+        dirty_rects = [screen_blit(player.image, player.rect)]
+        # Враги и пули рисуются пакетно: один вызов blits на категорию вместо blit на каждый объект
+        dirty_rects += screen_blits([(e.image, e.rect) for e in manager.enemies])
+        dirty_rects += screen_blits([(b.image, b.rect) for b in manager.bullets])
+        # Отображаем счёт и уровень на экране (font.render вызывается только при изменении значений)
+        score = manager.score
+        if score != self._score_cache[0]:
+            self._score_cache = (score, font_render(f"Score: {score}", True, (255, 255, 255)))
+        level = manager.level
+        if level != self._level_cache[0]:
+            self._level_cache = (level, font_render(f"Level: {level}", True, (255, 255, 255)))
+        dirty_rects.append(screen_blit(self._score_cache[1], (10, 10)))
+        dirty_rects.append(screen_blit(self._level_cache[1], (10, 40)))
+
+        if full_redraw:
             pygame.display.flip()
-            clock.tick(60)
+        else:
+            pygame.display.update(prev_rects + dirty_rects)
+        self._prev_rects = dirty_rects
+
+    def run_game(self):
+        """Запускает основной игровой цикл."""
+        clock = pygame.time.Clock()
+        screen = self.manager.screen
+        # Чёрный фон, из которого стираются области прошлого кадра (одним вызовом blits)
+        self._background = pygame.Surface(screen.get_size()).convert()
+        self._background.fill((0, 0, 0))
+        # Первый кадр выводится целиком, дальше обновляются только изменившиеся области
+        screen.blit(self._background, (0, 0))
+        pygame.display.flip()
+        self._prev_rects = []
+        self._accumulator = 0.0
+        running = True
+        while running:
+            running = self._process_events()
+            self._tick_physics(clock.tick(FPS))
+            self._draw_frame()
         pygame.quit()
 
 if __name__ == "__main__":
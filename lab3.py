@@ -59,18 +59,28 @@ class ResourceManager:
             # По умолчанию - белый квадрат 20x20
             surface = pygame.Surface((20, 20))
             surface.fill(WHITE)
+        # Приводим изображение к формату пикселей экрана, чтобы blit не конвертировал пиксели на каждом кадре
+        # (поэтому изображения можно запрашивать только после pygame.display.set_mode)
+        if surface.get_flags() & pygame.SRCALPHA:
+            surface = surface.convert_alpha()
+        else:
+            surface = surface.convert()
         self._images[name] = surface
         return surface
 
 
 # Паттерн Прототип: базовый класс для объектов, умеющих клонировать сами себя
 class Prototype:
+    __slots__ = ()  # пустые слоты, чтобы у наследников со __slots__ не появлялся __dict__
+
     def clone(self):
         raise NotImplementedError
 
 
 # Паттерн Стратегия: определяем интерфейс стратегии движения
 class MovementStrategy:
+    __slots__ = ()  # стратегии не хранят состояния
+
     def move(self, enemy, dt):
         """Абстрактное движение врага."""
         raise NotImplementedError
@@ -78,35 +88,39 @@ class MovementStrategy:
 
 # Конкретная стратегия: движение врага прямо вниз
 class StraightDownStrategy(MovementStrategy):
+    __slots__ = ()
+
     def move(self, enemy, dt):
-        # Враг движется вниз с постоянной скоростью
-        enemy.rect.y += int(enemy.speed * dt)
-        # Без изменения по горизонтали
+        # Враг движется вниз с постоянной скоростью, без изменения по горизонтали
+        enemy.rect.move_ip(0, int(enemy.speed * dt))
 
 
 # Конкретная стратегия: движение врага зигзагом
+# Стратегия не хранит состояния: направление и таймер смены направления лежат в самом враге
 class ZigZagStrategy(MovementStrategy):
-    def __init__(self):
-        self.direction = 1  # 1 - вправо, -1 - влево
-        self.switch_time = 0
+    __slots__ = ()
 
     def move(self, enemy, dt):
-        # Двигается вниз
-        enemy.rect.y += int(enemy.speed * dt)
-        # Смещается по горизонтали
-        enemy.rect.x += self.direction * 2  # сдвиг на 2 пикселя вбок каждый кадр
+        r = enemy.rect
+        # Двигается вниз и смещается по горизонтали на 2 пикселя вбок каждый кадр (одним вызовом move_ip)
+        r.move_ip(enemy.direction * 2, int(enemy.speed * dt))
         # Периодическая смена направления или при столкновении с границей
-        self.switch_time += dt
-        if self.switch_time > 0.5:  # менять направление каждые 0.5 секунды
-            self.switch_time = 0
-            self.direction *= -1
+        enemy.switch_time += dt
+        if enemy.switch_time > 0.5:  # менять направление каждые 0.5 секунды
+            enemy.switch_time = 0
+            enemy.direction *= -1
         # Не выходить за пределы экрана по горизонтали
-        if enemy.rect.left < 0:
-            enemy.rect.left = 0
-            self.direction = 1
-        elif enemy.rect.right > SCREEN_WIDTH:
-            enemy.rect.right = SCREEN_WIDTH
-            self.direction = -1
+        if r.left < 0:
+            r.left = 0
+            enemy.direction = 1
+        elif r.right > SCREEN_WIDTH:
+            r.right = SCREEN_WIDTH
+            enemy.direction = -1
+
+
+# Паттерн Легковес: стратегии без состояния существуют в единственном экземпляре и разделяются всеми врагами
+STRAIGHT_DOWN = StraightDownStrategy()
+ZIGZAG = ZigZagStrategy()
 
 
 # Паттерн Наблюдатель: определяем абстрактного наблюдателя
@@ -146,7 +160,7 @@ class EventManager:
 
 # Паттерн Абстрактная фабрика: фабрика для создания игровых объектов (игрок, враги, пули)
 class GameObjectFactory:
-    def __init__(self):
+    def __init__(self, on_enemy_killed=None):
         self.res = ResourceManager()  # используем менеджер ресурсов для изображений
         # Инициализируем прототипы (паттерн Прототип для пуль, возможно и для врагов)
         bullet_image = self.res.get_image("bullet")
@@ -154,8 +168,18 @@ class GameObjectFactory:
         # Создадим по одному прототипу для каждого типа врагов
         enemy_image1 = self.res.get_image("enemy1")
         enemy_image2 = self.res.get_image("enemy2")
-        self.enemy_prototype1 = Enemy(enemy_image1, speed=100, hp=1, strategy=StraightDownStrategy(), points=50)
-        self.enemy_prototype2 = Enemy(enemy_image2, speed=80, hp=2, strategy=ZigZagStrategy(), points=100)
+        # on_enemy_killed - функция обратного вызова при уничтожении врага, её получают все клоны прототипов
+        self.enemy_prototype1 = Enemy(enemy_image1, speed=100, hp=1, strategy=STRAIGHT_DOWN, points=50,
+                                      on_killed=on_enemy_killed)
+        self.enemy_prototype2 = Enemy(enemy_image2, speed=80, hp=2, strategy=ZIGZAG, points=100,
+                                      on_killed=on_enemy_killed)
+        # Пулы (free-list) отработавших объектов: вместо клонирования новых объектов переиспользуем старые,
+        # чтобы не нагружать сборщик мусора
+        self._bullet_pool = []
+        self._enemy_pool_1 = []
+        self._enemy_pool_2 = []
+        # Генератор случайных чисел на C, связанный один раз (randint - цепочка Python-вызовов на каждый спавн)
+        self._rand = random.random
 
     def create_player(self):
         # Создаём игрока с нужными параметрами
@@ -167,25 +191,54 @@ class GameObjectFactory:
         return player
 
     def create_enemy(self):
+        rand = self._rand
         # Создаём врага, выбирая тип для разнообразия
-        if random.random() < 0.5:
-            # Клонируем прототип врага типа 1 (движется прямо)
-            enemy = self.enemy_prototype1.clone()
+        if rand() < 0.5:
+            # Прототип врага типа 1 (движется прямо)
+            prototype, pool = self.enemy_prototype1, self._enemy_pool_1
         else:
-            # Клонируем прототип врага типа 2 (движется зигзагом)
-            enemy = self.enemy_prototype2.clone()
-        # Расположим врага в случайной позиции сверху
-        enemy.rect.x = random.randint(0, SCREEN_WIDTH - enemy.rect.width)
-        enemy.rect.y = -enemy.rect.height
+            # Прототип врага типа 2 (движется зигзагом)
+            prototype, pool = self.enemy_prototype2, self._enemy_pool_2
+        if pool:
+            # Берём врага из пула и возвращаем ему параметры прототипа
+            enemy = pool.pop()
+            enemy.speed = prototype.speed
+            enemy.hp = prototype.hp
+            enemy.points = prototype.points
+            enemy.direction = 1
+            enemy.switch_time = 0
+        else:
+            # Пул пуст - клонируем прототип
+            enemy = prototype.clone()
+        # Расположим врага в случайной позиции сверху (x равномерно от 0 до SCREEN_WIDTH - ширина включительно)
+        rect = enemy.rect
+        rect.x = int(rand() * (SCREEN_WIDTH - rect.width + 1))
+        rect.y = -rect.height
         return enemy
 
     def create_bullet(self, x, y):
-        # Клонируем прототип пули и устанавливаем её позицию
-        bullet = self.bullet_prototype.clone()
+        # Берём пулю из пула (или клонируем прототип, если пул пуст) и устанавливаем её позицию
+        if self._bullet_pool:
+            bullet = self._bullet_pool.pop()
+            bullet.speed = self.bullet_prototype.speed
+            bullet.damage = self.bullet_prototype.damage
+        else:
+            bullet = self.bullet_prototype.clone()
         bullet.rect.centerx = x
         bullet.rect.bottom = y
         return bullet
 
+    def recycle_bullet(self, bullet):
+        # Возвращаем отработавшую пулю в пул для повторного использования
+        self._bullet_pool.append(bullet)
+
+    def recycle_enemy(self, enemy):
+        # Возвращаем уничтоженного или улетевшего врага в пул его типа
+        if enemy.strategy is ZIGZAG:
+            self._enemy_pool_2.append(enemy)
+        else:
+            self._enemy_pool_1.append(enemy)
+
 
 # Паттерн Заместитель (Proxy): Реальный объект оружия, создающий пули
 class Gun:
@@ -193,8 +246,8 @@ class Gun:
         self.factory = factory
         self.owner = owner  # владелец оружия (игрок или враг, здесь игрок)
 
-    def shoot(self):
-        # Создать пулю в позиции владельца
+    def shoot(self, now):
+        # Создать пулю в позиции владельца (now - игровое время, нужно только заместителю, но интерфейс общий)
         x = self.owner.rect.centerx
         y = self.owner.rect.top
         bullet = self.factory.create_bullet(x, y)
@@ -206,14 +259,14 @@ class RateLimitedGun:
     def __init__(self, real_gun, cooldown):
         self.real_gun = real_gun
         self.cooldown = cooldown  # задержка между выстрелами (секунд)
-        self.last_shot_time = 0.0
+        self.last_shot_time = -cooldown  # первый выстрел доступен сразу
 
-    def shoot(self):
-        current_time = pygame.time.get_ticks() / 1000.0  # текущее время в секундах
-        if current_time - self.last_shot_time >= self.cooldown:
+    def shoot(self, now):
+        # now - игровое время в секундах (накапливается из dt в PlayingState), системные часы не опрашиваются
+        if now - self.last_shot_time >= self.cooldown:
             # Достаточно времени прошло, можно стрелять
-            self.last_shot_time = current_time
-            return self.real_gun.shoot()
+            self.last_shot_time = now
+            return self.real_gun.shoot(now)
         else:
             # Ещё перезарядка не завершена, выстрел не производится
             return None
@@ -222,6 +275,9 @@ class RateLimitedGun:
 # Игровые объекты:
 
 class Bullet(Prototype):
+    # Фиксированный набор атрибутов вместо __dict__: экземпляры меньше, доступ к атрибутам быстрее
+    __slots__ = ('image', 'rect', 'speed', 'damage')
+
     def __init__(self, image, speed=300):
         self.image = image
         self.rect = image.get_rect()
@@ -238,27 +294,30 @@ class Bullet(Prototype):
 
     def update(self, dt):
         # Движение пули вверх (уменьшение координаты Y)
-        self.rect.y -= int(self.speed * dt)
+        self.rect.move_ip(0, -int(self.speed * dt))
 
 
 class Enemy(Prototype):
-    def __init__(self, image, speed, hp, strategy: MovementStrategy, points=100):
+    __slots__ = ('image', 'rect', 'speed', 'hp', 'strategy', 'points', 'direction', 'switch_time', 'on_killed')
+
+    def __init__(self, image, speed, hp, strategy: MovementStrategy, points=100, on_killed=None):
         self.image = image
         self.rect = image.get_rect()
         self.speed = speed
         self.hp = hp
         self.strategy = strategy  # Паттерн Стратегия: компоновка с объектом стратегии движения
         self.points = points
+        # Состояние движения врага (используется стратегией зигзага): 1 - вправо, -1 - влево
+        self.direction = 1
+        self.switch_time = 0
+        # Прямой обратный вызов при гибели врага (вызывается с количеством очков) вместо рассылки через EventManager
+        self.on_killed = on_killed
 
     # Паттерн Прототип: метод clone для дублирования врага
     def clone(self):
         # Создаём нового врага с теми же свойствами.
-        # Обращаем внимание: даём новой копии свой собственный экземпляр стратегии (чтобы не разделять состояние стратегии между врагами).
-        if isinstance(self.strategy, ZigZagStrategy):
-            new_strategy = ZigZagStrategy()
-        else:
-            new_strategy = StraightDownStrategy()
-        new_enemy = Enemy(self.image, self.speed, self.hp, new_strategy, self.points)
+        # Стратегия движения не хранит состояния, поэтому копия разделяет тот же экземпляр стратегии (легковес).
+        new_enemy = Enemy(self.image, self.speed, self.hp, self.strategy, self.points, self.on_killed)
         return new_enemy
 
     def update(self, dt):
@@ -271,13 +330,16 @@ class Enemy(Prototype):
     def take_damage(self, dmg):
         self.hp -= dmg
         if self.hp <= 0:
-            # Враг погибает, уведомляем наблюдателей о событии "enemy_killed"
-            EventManager().notify("enemy_killed", self.points)
+            # Враг погибает, сообщаем о нём напрямую через обратный вызов
+            if self.on_killed is not None:
+                self.on_killed(self.points)
             return True
         return False
 
 
 class Player:
+    __slots__ = ('image', 'rect', 'speed', 'lives', 'gun')
+
     def __init__(self, image, speed=200, lives=3):
         self.image = image
         self.rect = image.get_rect()
@@ -290,16 +352,16 @@ class Player:
 
     def move(self, dx, dt):
         # Перемещение по горизонтали (dx = -1 влево, 1 вправо)
-        self.rect.x += int(dx * self.speed * dt)
+        self.rect.move_ip(int(dx * self.speed * dt), 0)
         # Не выходить за границы экрана
         if self.rect.left < 0:
             self.rect.left = 0
         if self.rect.right > SCREEN_WIDTH:
             self.rect.right = SCREEN_WIDTH
 
-    def shoot(self):
+    def shoot(self, now):
         if self.gun:
-            bullet = self.gun.shoot()
+            bullet = self.gun.shoot(now)
             return bullet
         return None
 
@@ -312,38 +374,82 @@ class Scoreboard(Observer):
         # Шрифт для отображения текста
         self.font = pygame.font.Font(None, 36)
         self.color = WHITE
+        # Подписи и цифры растеризуются шрифтом один раз; при изменении счёта строка табло
+        # собирается из готовых поверхностей без повторной растеризации текста
+        self._score_label = self.font.render("Score: ", True, self.color).convert_alpha()
+        self._lives_label = self.font.render("   Lives: ", True, self.color).convert_alpha()
+        self._digit_surfs = {ch: self.font.render(ch, True, self.color).convert_alpha() for ch in "-0123456789"}
+        # Кеш собранного табло: пересобирается только после изменения счёта или жизней
+        self._dirty = True
+        self._cached_surface = None
 
     def update(self, event_type, data):
         # Реакция на события (метод наблюдателя)
         if event_type == "enemy_killed":
-            # Увеличиваем счёт (data передаёт количество очков за врага)
-            if data is not None:
-                self.score += data
-            else:
-                self.score += 100
+            self.add_points(data)
         elif event_type == "player_hit":
-            # Уменьшаем число жизней при попадании по игроку
-            if data is not None:
-                self.lives = data
-            else:
-                self.lives -= 1
+            self.set_lives(data)
         # Событие "player_died" здесь можно обработать при необходимости (например, остановить таймер и т.п.)
 
+    # Частые события (уничтожение врага, попадание по игроку) приходят сюда напрямую, минуя EventManager
+    def add_points(self, points=None):
+        # Увеличиваем счёт (points - количество очков за врага)
+        if points is not None:
+            self.score += points
+        else:
+            self.score += 100
+        self._dirty = True
+
+    def set_lives(self, lives=None):
+        # Уменьшаем число жизней при попадании по игроку
+        if lives is not None:
+            self.lives = lives
+        else:
+            self.lives -= 1
+        self._dirty = True
+
     def draw(self, surface):
         # Отображение счёта и количества жизней на экране
-        text = self.font.render(f"Score: {self.score}   Lives: {self.lives}", True, self.color)
-        surface.blit(text, (10, 10))
+        if self._dirty:
+            self._cached_surface = self._compose()
+            self._dirty = False
+        # Возвращаем область экрана, занятую табло (для частичного обновления дисплея)
+        return surface.blit(self._cached_surface, (10, 10))
+
+    def _compose(self):
+        # Складываем строку "Score: N   Lives: M" из заранее отрисованных подписей и цифр.
+        # Позиция каждого куска - ширина строки до него по font.size (только измерение, без растеризации),
+        # поэтому кернинг между символами учитывается и ширина табло совпадает с font.render всей строки.
+        # Отдельные глифы при этом могут сместиться на 1-2 пикселя относительно рендера целой строки:
+        # внутри одной строки SDL_ttf выравнивает глифы с субпиксельной точностью
+        digits = self._digit_surfs
+        score, lives = str(self.score), str(self.lives)
+        parts = [("Score: ", self._score_label)]
+        parts += [(ch, digits[ch]) for ch in score]
+        parts.append(("   Lives: ", self._lives_label))
+        parts += [(ch, digits[ch]) for ch in lives]
+        line = f"Score: {score}   Lives: {lives}"
+        size = self.font.size
+        text = pygame.Surface(size(line), pygame.SRCALPHA).convert_alpha()
+        pos = 0
+        for chars, part in parts:
+            text.blit(part, (size(line[:pos])[0], 0))
+            pos += len(chars)
+        return text
 
     def reset(self, lives):
         # Сброс счета и жизней (например, при перезапуске игры)
         self.score = 0
         self.lives = lives
+        self._dirty = True
 
 
 # Паттерн Состояние: абстрактный класс состояния игры
 class GameState:
     def __init__(self, game):
         self.game = game  # ссылка на контекст (игру)
+        # Области экрана, изменённые последним вызовом draw; Game выводит на дисплей только их
+        self.dirty_rects = []
 
     def handle_events(self):
         raise NotImplementedError
@@ -354,16 +460,36 @@ class GameState:
     def draw(self, surface):
         raise NotImplementedError
 
+    def invalidate(self):
+        # Содержимое окна потеряно (окно перекрывали или сворачивали): следующий draw рисует экран целиком
+        pass
+
 
 # Конкретное состояние: игровой процесс (игра в активном режиме)
 class PlayingState(GameState):
+    # Размер ячейки пространственной сетки для проверки столкновений (больше любого игрового объекта)
+    CELL = 64
+
     def __init__(self, game):
         super().__init__(game)
         # Создаём игрока и начальные игровые объекты через фабрику
         self.player = game.factory.create_player()
         self.bullets = []  # список пуль на экране
         self.enemies = []  # список врагов на экране
+        # Пространственная сетка: (cell_x, cell_y) -> (список врагов, центр которых лежит в этой ячейке,
+        # параллельный список их Rect для проверки пересечений через collidelistall)
+        self.enemy_grid = {}
         self.spawn_timer = 0  # таймер для появления врагов
+        self._game_time = 0.0  # игровое время состояния в секундах (сумма dt), используется для перезарядки оружия
+        # Области, где объекты были нарисованы на прошлом кадре (None - экран ещё не рисовался этим состоянием)
+        self._prev_rects = None
+        # Коды клавиш управления сохраняем заранее, чтобы не искать их в модуле pygame каждый кадр
+        self._K_LEFT = pygame.K_LEFT
+        self._K_RIGHT = pygame.K_RIGHT
+        self._K_SPACE = pygame.K_SPACE
+        # Прямые ссылки на обработчики частых событий (вместо EventManager().notify)
+        self._on_enemy_killed = game.scoreboard.add_points
+        self._on_player_hit = game.scoreboard.set_lives
         # Сбросить счёт и жизни на начало игры
         game.scoreboard.reset(self.player.lives)
 
@@ -372,74 +498,211 @@ class PlayingState(GameState):
             if event.type == pygame.QUIT:
                 # Выход из игры
                 self.game.running = False
+            elif event.type == pygame.WINDOWEXPOSED:
+                self.game.redraw_all()
+
+    def invalidate(self):
+        # Следующий кадр рисуется на полностью очищенном экране, как первый
+        self._prev_rects = None
+
+    def _all_hits(self, rect):
+        """
+        Все враги из ячейки центра rect и соседних ячеек, которые пересекаются с rect.
+        Для каждой ячейки выполняется один вызов collidelistall вместо попарных colliderect.
+        """
+        cell = self.CELL
+        cx, cy = rect.centerx // cell, rect.centery // cell
+        grid = self.enemy_grid
+        hits = []
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                bucket = grid.get((gx, gy))
+                if bucket is not None:
+                    cell_enemies = bucket[0]
+                    for i in rect.collidelistall(bucket[1]):
+                        hits.append(cell_enemies[i])
+        return hits
+
+    def _bullet_hits(self, bullets, skip):
+        """
+        Пары (пуля, враг) для пуль, попавших во врага, не входящего в skip.
+        Пули раскладываются по ячейкам сетки; для каждой занятой ячейки враги и их Rect из окрестности 3x3
+        собираются один раз, и все пули ячейки проверяются против них на C: collidelist (первый индекс или -1),
+        а если этот враг уже уничтожен - collidelistall. skip проверяется в момент выдачи пары,
+        поэтому враг, уничтоженный предыдущей пулей, следующим пулям уже не достаётся.
+        """
+        cell = self.CELL
+        grid = self.enemy_grid
+        bullet_cells = {}
+        for bullet in bullets:
+            rect = bullet.rect
+            key = (rect.centerx // cell, rect.centery // cell)
+            cell_bullets = bullet_cells.get(key)
+            if cell_bullets is None:
+                bullet_cells[key] = cell_bullets = []
+            cell_bullets.append(bullet)
+        for (cx, cy), cell_bullets in bullet_cells.items():
+            near_enemies = []
+            near_rects = []
+            for gx in (cx - 1, cx, cx + 1):
+                for gy in (cy - 1, cy, cy + 1):
+                    bucket = grid.get((gx, gy))
+                    if bucket is not None:
+                        near_enemies += bucket[0]
+                        near_rects += bucket[1]
+            if not near_rects:
+                continue
+            for bullet in cell_bullets:
+                rect = bullet.rect
+                i = rect.collidelist(near_rects)
+                if i < 0:
+                    continue
+                if near_enemies[i] in skip:
+                    for i in rect.collidelistall(near_rects):
+                        if near_enemies[i] not in skip:
+                            break
+                    else:
+                        continue
+                yield bullet, near_enemies[i]
 
     def update(self, dt):
+        # Часто используемые атрибуты и методы один раз связываем с локальными переменными,
+        # чтобы в циклах не искать их заново через цепочки self.xxx.yyy
+        player = self.player
+        factory = self.game.factory
+        recycle_bullet = factory.recycle_bullet
+        recycle_enemy = factory.recycle_enemy
+        bullets = self.bullets
+        enemies = self.enemies
+        on_player_hit = self._on_player_hit
+        self._game_time += dt
         # Появление новых врагов с течением времени
         self.spawn_timer += dt
         if self.spawn_timer > 1.0:  # раз в 1 секунду
-            enemy = self.game.factory.create_enemy()
-            self.enemies.append(enemy)
+            enemies.append(factory.create_enemy())
             self.spawn_timer = 0
         # Обработка ввода для движения и стрельбы
+        kl, kr, ks = self._K_LEFT, self._K_RIGHT, self._K_SPACE
         keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT]:
-            self.player.move(-1, dt)
-        if keys[pygame.K_RIGHT]:
-            self.player.move(1, dt)
-        if keys[pygame.K_SPACE]:
-            bullet = self.player.shoot()
+        move = player.move
+        if keys[kl]:
+            move(-1, dt)
+        if keys[kr]:
+            move(1, dt)
+        if keys[ks]:
+            bullet = player.shoot(self._game_time)
             if bullet:
-                self.bullets.append(bullet)
-        # Обновление позиций пуль
-        for bullet in list(self.bullets):
-            bullet.update(dt)
+                bullets.append(bullet)
+        # Объекты удаляются из списков перестановкой с последним элементом и pop() (swap-and-pop):
+        # без копий списков и без O(N) list.remove. Порядок отрисовки одинаковых спрайтов не важен.
+        # Обновление позиций пуль (обход с конца, чтобы на место удалённой вставала уже обработанная пуля).
+        # Движение пули (то же, что Bullet.update) выполняется прямо в цикле: все пули берут скорость
+        # из одного прототипа, поэтому смещение за кадр int(speed * dt) считается один раз, а не для каждой пули
+        last_speed = None
+        dy = 0
+        i = len(bullets) - 1
+        while i >= 0:
+            bullet = bullets[i]
+            if bullet.speed != last_speed:
+                last_speed = bullet.speed
+                dy = int(last_speed * dt)
+            rect = bullet.rect
+            rect.move_ip(0, -dy)
             # Удаляем пулю, если вышла за верхний край экрана
-            if bullet.rect.bottom < 0:
-                self.bullets.remove(bullet)
-        # Обновление позиций врагов
-        for enemy in list(self.enemies):
+            if rect.bottom < 0:
+                bullets[i] = bullets[-1]
+                bullets.pop()
+                recycle_bullet(bullet)
+            i -= 1
+        # Обновление позиций врагов; оставшиеся на экране враги заносятся в пространственную сетку
+        grid = self.enemy_grid
+        grid.clear()
+        grid_get = grid.get
+        cell = self.CELL
+        i = len(enemies) - 1
+        while i >= 0:
+            enemy = enemies[i]
+            i -= 1
             enemy.update(dt)
-            # Если враг ушёл за нижний край экрана
-            if enemy.is_off_screen():
-                self.enemies.remove(enemy)
+            rect = enemy.rect
+            # Если враг ушёл за нижний край экрана (то же, что Enemy.is_off_screen, без вызова метода)
+            if rect.y > SCREEN_HEIGHT:
+                enemies[i + 1] = enemies[-1]
+                enemies.pop()
+                recycle_enemy(enemy)
                 # Считаем, что игрок пропустил врага - потеря жизни
-                EventManager().notify("player_hit", self.player.lives - 1)
-                self.player.lives -= 1
+                on_player_hit(player.lives - 1)
+                player.lives -= 1
                 # Если жизни кончились - сообщаем о смерти игрока и выходим из состояния
-                if self.player.lives <= 0:
-                    EventManager().notify("player_died", None)
-                    return
-                continue
-            # Проверка столкновения врага с игроком
-            if enemy.rect.colliderect(self.player.rect):
-                # Столкновение с игроком - враг уничтожается, игрок теряет жизнь
-                self.enemies.remove(enemy)
-                EventManager().notify("player_hit", self.player.lives - 1)
-                self.player.lives -= 1
-                if self.player.lives <= 0:
+                if player.lives <= 0:
                     EventManager().notify("player_died", None)
                     return
                 continue
-            # Проверка столкновения врага с пулями
-            for bullet in list(self.bullets):
-                if bullet.rect.colliderect(enemy.rect):
-                    # Пуля попала во врага
-                    self.bullets.remove(bullet)
-                    died = enemy.take_damage(bullet.damage)
-                    if died:
-                        # Враг уничтожен (take_damage уже отправил событие enemy_killed)
-                        self.enemies.remove(enemy)
-                    break  # выходим из цикла по пулям, т.к. текущий враг уже получил повреждение
+            key = (rect.centerx // cell, rect.centery // cell)
+            bucket = grid_get(key)
+            if bucket is None:
+                grid[key] = bucket = ([], [])
+            bucket[0].append(enemy)
+            bucket[1].append(rect)
+        # Уничтоженные при столкновениях объекты собираются в множества и удаляются одним проходом в конце
+        dead_bullets = set()
+        dead_enemies = set()
+        # Проверка столкновения врагов с игроком: только враги из ячеек рядом с игроком
+        for enemy in self._all_hits(player.rect):
+            # Столкновение с игроком - враг уничтожается, игрок теряет жизнь
+            dead_enemies.add(enemy)
+            on_player_hit(player.lives - 1)
+            player.lives -= 1
+            if player.lives <= 0:
+                EventManager().notify("player_died", None)
+                return
+        # Проверка столкновения пуль с врагами: пули каждой ячейки проверяются только против врагов окрестности
+        if grid and bullets:
+            for bullet, enemy in self._bullet_hits(bullets, dead_enemies):
+                # Пуля попала во врага
+                dead_bullets.add(bullet)
+                if enemy.take_damage(bullet.damage):
+                    # Враг уничтожен (take_damage уже начислил очки через on_killed)
+                    dead_enemies.add(enemy)
+        # Убранные с экрана объекты возвращаются в пулы фабрики
+        if dead_bullets:
+            self._swap_remove(bullets, dead_bullets)
+            for bullet in dead_bullets:
+                recycle_bullet(bullet)
+        if dead_enemies:
+            self._swap_remove(enemies, dead_enemies)
+            for enemy in dead_enemies:
+                recycle_enemy(enemy)
+
+    @staticmethod
+    def _swap_remove(items, dead):
+        """Удаляет из списка на месте все элементы множества dead перестановкой с последним элементом."""
+        i = len(items) - 1
+        while i >= 0:
+            if items[i] in dead:
+                items[i] = items[-1]
+                items.pop()
+            i -= 1
 
     def draw(self, surface):
-        surface.fill(BLACK)
-        # Отрисовка игрока, пуль, врагов и табло
-        surface.blit(self.player.image, self.player.rect)
-        for bullet in self.bullets:
-            surface.blit(bullet.image, bullet.rect)
-        for enemy in self.enemies:
-            surface.blit(enemy.image, enemy.rect)
-        self.game.scoreboard.draw(surface)
+        prev_rects = self._prev_rects
+        if prev_rects is None:
+            # Первый кадр состояния рисуется на полностью очищенном экране
+            surface.fill(BLACK)
+            prev_rects = []
+        else:
+            # Экран целиком не очищается: фоном стираются только области, занятые объектами на прошлом кадре
+            background = self.game.background
+            surface.blits([(background, rect, rect) for rect in prev_rects], doreturn=False)
+        # Отрисовка игрока, пуль и врагов одним пакетным вызовом blits, затем табло
+        blit_seq = [(self.player.image, self.player.rect)]
+        blit_seq += [(bullet.image, bullet.rect) for bullet in self.bullets]
+        blit_seq += [(enemy.image, enemy.rect) for enemy in self.enemies]
+        drawn_rects = surface.blits(blit_seq)
+        drawn_rects.append(self.game.scoreboard.draw(surface))
+        # Обновить на дисплее нужно и стёртые старые области, и новые
+        self.dirty_rects = prev_rects + drawn_rects
+        self._prev_rects = drawn_rects
 
 
 # Конкретное состояние: экран Game Over
@@ -449,8 +712,14 @@ class GameOverState(GameState):
         # Подготавливаем текст "Game Over" и инструкцию по перезапуску
         self.font = pygame.font.Font(None, 72)
         self.subfont = pygame.font.Font(None, 36)
-        self.text = self.font.render("GAME OVER", True, RED)
-        self.subtext = self.subfont.render("Press R to Restart or Q to Quit", True, WHITE)
+        self.text = self.font.render("GAME OVER", True, RED).convert_alpha()
+        self.subtext = self.subfont.render("Press R to Restart or Q to Quit", True, WHITE).convert_alpha()
+        # Финальный счёт в этом состоянии не меняется, поэтому текст и позиции вычисляются один раз
+        self.score_text = self.subfont.render(f"Final Score: {game.scoreboard.score}", True, WHITE).convert_alpha()
+        self._text_pos = ((SCREEN_WIDTH - self.text.get_width()) // 2, SCREEN_HEIGHT // 2 - 50)
+        self._subtext_pos = ((SCREEN_WIDTH - self.subtext.get_width()) // 2, SCREEN_HEIGHT // 2 + 10)
+        self._score_pos = ((SCREEN_WIDTH - self.score_text.get_width()) // 2, SCREEN_HEIGHT // 2 + 50)
+        self._drawn = False
 
     def handle_events(self):
         for event in pygame.event.get():
@@ -463,18 +732,28 @@ class GameOverState(GameState):
                 elif event.key == pygame.K_q or event.key == pygame.K_ESCAPE:
                     # Выход из игры при нажатии Q или Esc
                     self.game.running = False
+            elif event.type == pygame.WINDOWEXPOSED:
+                self.game.redraw_all()
+
+    def invalidate(self):
+        # Статичный экран рисуется заново на следующем кадре
+        self._drawn = False
 
     def update(self, dt):
         # На экране Game Over ничего не обновляется
         pass
 
     def draw(self, surface):
+        # Экран Game Over статичен: он рисуется один раз (при смене состояния Game выводит его целиком),
+        # на следующих кадрах рисовать и обновлять нечего, dirty_rects остаётся пустым
+        if self._drawn:
+            return
         surface.fill(BLACK)
         # Выводим сообщение "Game Over" и финальный счёт
-        surface.blit(self.text, ((SCREEN_WIDTH - self.text.get_width()) // 2, SCREEN_HEIGHT // 2 - 50))
-        surface.blit(self.subtext, ((SCREEN_WIDTH - self.subtext.get_width()) // 2, SCREEN_HEIGHT // 2 + 10))
-        score_text = self.subfont.render(f"Final Score: {self.game.scoreboard.score}", True, WHITE)
-        surface.blit(score_text, ((SCREEN_WIDTH - score_text.get_width()) // 2, SCREEN_HEIGHT // 2 + 50))
+        surface.blit(self.text, self._text_pos)
+        surface.blit(self.subtext, self._subtext_pos)
+        surface.blit(self.score_text, self._score_pos)
+        self._drawn = True
 
 
 # Паттерн Фасад: класс Game упрощает запуск игры и переключение состояний (выступает интерфейсом для управления игровым процессом)
@@ -483,15 +762,25 @@ class Game(Observer):
         # Инициализация окна
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Shooter Game - Design Patterns Demo")
+        # В очередь событий пропускаем только то, что реально обрабатывается: выход, нажатия клавиш
+        # и WINDOWEXPOSED (после перекрытия или восстановления окна экран нужно вывести целиком, а не
+        # только изменившиеся области); движение мыши и прочие события отбрасываются SDL ещё до попадания
+        # в очередь. Движение и стрельба опрашиваются через key.get_pressed, поэтому KEYUP не нужен
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.WINDOWEXPOSED])
+        # Чёрный фон, которым состояния стирают области прошлого кадра (одним вызовом blits)
+        self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.background.fill(BLACK)
         self.clock = pygame.time.Clock()
         self.running = True
+        self._full_redraw = False  # вывести на следующем кадре весь экран, а не только изменившиеся области
         # Создание основных компонентов
-        self.factory = GameObjectFactory()
         self.scoreboard = Scoreboard(initial_lives=3)
-        # Паттерн Наблюдатель: подписываем табло на игровые события, а Game на событие смены состояния (смерть игрока)
+        # Частые события идут в табло напрямую: уничтожение врага - через on_killed врагов,
+        # попадание по игроку - через ссылку в PlayingState
+        self.factory = GameObjectFactory(on_enemy_killed=self.scoreboard.add_points)
+        # Паттерн Наблюдатель: Game подписывается на редкое событие смены состояния (смерть игрока)
         em = EventManager()
-        em.subscribe("enemy_killed", self.scoreboard)
-        em.subscribe("player_hit", self.scoreboard)
         em.subscribe("player_died", self)  # Game будет следить за смертью игрока, чтобы переключить состояние
         # Начальное состояние игры - PlayingState
         self.current_state = PlayingState(self)
@@ -506,8 +795,14 @@ class Game(Observer):
         # Метод для смены текущего состояния (паттерн Состояние)
         self.current_state = new_state
 
+    def redraw_all(self):
+        # Окно было перекрыто или восстановлено: текущее состояние рисуется заново и экран выводится целиком
+        self.current_state.invalidate()
+        self._full_redraw = True
+
     def run(self):
         # Основной игровой цикл
+        shown_state = None  # состояние, нарисованное на прошлом кадре
         while self.running:
             dt = self.clock.tick(FPS) / 1000.0  # разница времени между кадрами в секундах
             # Делегируем обработку событий, обновление и отрисовку текущему состоянию
@@ -516,7 +811,14 @@ class Game(Observer):
             # (если состояние сменилось в процессе обновления, получаем новое состояние перед отрисовкой)
             state = self.current_state
             state.draw(self.screen)
-            pygame.display.flip()
+            if state is not shown_state or self._full_redraw:
+                # При смене состояния или после перекрытия окна экран выводится целиком
+                pygame.display.flip()
+                shown_state = state
+                self._full_redraw = False
+            elif state.dirty_rects:
+                # Иначе на дисплей выводятся только изменившиеся области
+                pygame.display.update(state.dirty_rects)
         pygame.quit()
 
 